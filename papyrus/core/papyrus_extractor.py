@@ -67,32 +67,70 @@ class PapyrusExtractor:
         check_config(extractor)
         self.extractor_factory = extractorfactory
 
-    def get_text(self, path, format = "raw",correct=False)->str:
-        extractor = self.extractor_factory.get_processor(self.extractor, capabilities = ['text'])
+    def get_text(self, path, format = "raw",correct=False, ocr=False)->str:
+        capabilities = ['text', 'text_ocr'] if ocr else ['text']
+        extractor = self.extractor_factory.get_processor(self.extractor, capabilities = capabilities)
         if correct :
             from papyrus.tools import speling_correction
-            text = extractor.get_text(path, format=format)
+            text = extractor.get_text(path, format=format, ocr=ocr)
             text = speling_correction.correct_spelling_text(text)
             return text
         else:
-            return extractor.get_text(path, format=format)
+            return extractor.get_text(path, format=format, ocr=ocr)
 
-    def get_tables(self, path, correct=False)->List:
-        extractor = self.extractor_factory.get_processor(self.extractor, capabilities = ['tables'])
+    def get_tables(self, path, correct=False, ocr=False, **kwargs)->List:
+        """
+        Extract the tables of a pdf.
+        Extra keyword arguments are passed to the extractor, e.g. `n_jobs` and `chunk_size` for camelot.
+        """
+        capabilities = ['tables', 'tables_ocr'] if ocr else ['tables']
+        extractor = self.extractor_factory.get_processor(self.extractor, capabilities = capabilities)
         if correct:
             from papyrus.tools import speling_correction
-            tables = extractor.get_tables(path)
+            tables = extractor.get_tables(path, ocr=ocr, **kwargs)
             tables = speling_correction.correct_spelling_tables(tables)
             return tables
         else:
-            return extractor.get_tables(path)
+            return extractor.get_tables(path, ocr=ocr, **kwargs)
+
+    def get_text_batch(self, paths, format="raw", ocr=False)->List[str]:
+        """Extract the text of several documents, batched by the extractor when it supports it (docling)."""
+        capabilities = ['text', 'text_ocr'] if ocr else ['text']
+        extractor = self.extractor_factory.get_processor(self.extractor, capabilities = capabilities)
+        return extractor.get_text_batch(paths, format=format, ocr=ocr)
+
+    def get_tables_batch(self, paths, ocr=False, **kwargs)->List[List]:
+        """
+        Extract the tables of several documents, batched by the extractor when it supports it (docling).
+        Extra keyword arguments are passed to the extractor, e.g. `n_jobs` and `chunk_size` for camelot.
+        """
+        capabilities = ['tables', 'tables_ocr'] if ocr else ['tables']
+        extractor = self.extractor_factory.get_processor(self.extractor, capabilities = capabilities)
+        return extractor.get_tables_batch(paths, ocr=ocr, **kwargs)
         
-    def get_all(self, path, correct=False):
-        extractor = self.extractor_factory.get_processor(self.extractor, capabilities = ["text", "tables"])
+    def get_all(self, path, correct=False, ocr=False):
+        capabilities = ["text", "tables", "text_ocr", "tables_ocr"] if ocr else ["text", "tables"]
+        extractor = self.extractor_factory.get_processor(self.extractor, capabilities = capabilities)
         if correct:
             from papyrus.tools import speling_correction
-            all_extraction = extractor.get_all(path)
+            all_extraction = extractor.get_all(path, ocr=ocr)
             all_extraction = speling_correction.correct_spelling_text(all_extraction)
             return all_extraction
         else:
-            return extractor.get_all(path)
+            return extractor.get_all(path, ocr=ocr)
+
+    def save(self, path, store_path, format="raw"):
+        """
+        Extract the text page by page and the tables of a pdf, and write them to a store file.
+        The store can then be read page by page or table by table with `papyrus.tools.extraction_store.ExtractionStore`.
+
+        Args:
+            path (str): path of the pdf file.
+            store_path (str): path of the store file to write.
+            format (str): format of the pages text, "raw" or "markdown" (docling only).
+        """
+        from papyrus.tools.extraction_store import write_store
+
+        extractor = self.extractor_factory.get_processor(self.extractor, capabilities=[])
+        pages, tables = extractor.get_pages_and_tables(path, format=format)
+        write_store(store_path, pages, tables)
@@ -11,7 +11,9 @@
 
 import os
 import copy
+import warnings
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, List
 
 
@@ -44,66 +46,168 @@ class BaseExtractor(ABC):
     def get_all(self, path: str, **kwargs):
         pass
 
+    @abstractmethod
+    def get_pages(self, path: str, **kwargs) -> List[str]:
+        """Extract the text of each page, in page order."""
+        pass
+
+    def get_pages_and_tables(self, path: str, **kwargs):
+        """
+        Extract the text of each page and the tables, for the capabilities of the extractor.
+        Extractors without the text capability return one empty page per pdf page.
+        """
+        pages = self.get_pages(path, **kwargs)
+        tables = self.get_tables(path, **kwargs) if "tables" in self.capabilities else []
+        return pages, tables
+
+    def get_text_batch(self, paths: List[str], **kwargs) -> List[str]:
+        """Extract the text of several documents, in the order of `paths`."""
+        return [self.get_text(path, **kwargs) for path in paths]
+
+    def get_tables_batch(self, paths: List[str], **kwargs) -> List[List]:
+        """Extract the tables of several documents, in the order of `paths`."""
+        return [self.get_tables(path, **kwargs) for path in paths]
+
+
+@lru_cache(maxsize=None)
+def _docling_converter(do_ocr: bool, do_table_structure: bool):
+    """
+    Build a docling converter running only the requested models on pdf files.
+    Converters are cached, so the models are loaded once per set of options.
+    """
+    try:
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import PdfPipelineOptions
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+    except ImportError:
+        raise ImportError("'docling' is not installed. Run `pip install docling`")
+
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = do_ocr
+    pipeline_options.do_table_structure = do_table_structure
+    return DocumentConverter(
+        format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)}
+    )
+
 
 class DoclingExtractor(BaseExtractor):
+    """
+    The docling pipeline is set from the requested capability: the table structure model only runs
+    to extract tables, and OCR only runs when `ocr=True` is passed ("text_ocr" / "tables_ocr" capabilities).
+    """
+
     def __init__(self):
         super().__init__()
-        self.capabilities = {"text", "tables", "text_ocr", "tables_orc"}
+        self.capabilities = {"text", "tables", "text_ocr", "tables_ocr"}
 
-    def get_text(self, path: str, **kwargs)->str:
-        format = kwargs.get("format", "raw")
-        try:
-            from docling.document_converter import DocumentConverter
-        except ImportError:
-            raise ImportError("'docling' is not installed. Run `pip install docling`")
-
-        doc_converter = DocumentConverter()
-        conv_res = doc_converter.convert(path)
+    @staticmethod
+    def _export_text(document, format: str) -> str:
         if format == "raw":
-            page_text = conv_res.document.export_to_text()
+            return document.export_to_text()
         elif format == "markdown":
-            page_text = conv_res.document.export_to_markdown()
-        return page_text
-
-    def get_tables(self, path: str)->List:
-        try:
-            from docling.document_converter import DocumentConverter
-        except ImportError:
-            raise ImportError("'docling' is not installed. Run `pip install docling`")
+            return document.export_to_markdown()
+        raise ValueError(f"Unsupported format {format}")
+
+    @staticmethod
+    def _export_pages(document, format: str) -> List[str]:
+        if format not in ("raw", "markdown"):
+            raise ValueError(f"Unsupported format {format}")
+        pages = []
+        for page_no in sorted(document.pages):
+            if format == "raw":
+                # export_to_text only takes page_no in recent docling-core, it is this export underneath
+                page_text = document.export_to_markdown(page_no=page_no, strict_text=True)
+            else:
+                page_text = document.export_to_markdown(page_no=page_no)
+            pages.append(page_text)
+        return pages
+
+    @staticmethod
+    def _export_tables(document) -> List:
         try:
             import pandas as pd
         except ImportError:
             raise ImportError("'pandas' is not installed. Run `pip install pandas`")
 
-        doc_converter = DocumentConverter()
-        conv_res = doc_converter.convert(path)
         tables = []
-        for table in conv_res.document.tables:
+        for table in document.tables:
             table_df: pd.DataFrame = table.export_to_dataframe()
+            if table.prov:
+                table_df.attrs["page"] = table.prov[0].page_no
             tables.append(table_df)
         return tables
-    
+
+    def get_text(self, path: str, **kwargs)->str:
+        format = kwargs.get("format", "raw")
+        doc_converter = _docling_converter(do_ocr=kwargs.get("ocr", False), do_table_structure=False)
+        conv_res = doc_converter.convert(path)
+        return self._export_text(conv_res.document, format)
+
+    def get_tables(self, path: str, **kwargs)->List:
+        doc_converter = _docling_converter(do_ocr=kwargs.get("ocr", False), do_table_structure=True)
+        conv_res = doc_converter.convert(path)
+        return self._export_tables(conv_res.document)
+
     def get_all(self, path: str, **kwargs):
         format = kwargs.get("format", "raw")
-        try:
-            from docling.document_converter import DocumentConverter
-        except ImportError:
-            raise ImportError("'docling' is not installed. Run `pip install docling`")
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError("'pandas' is not installed. Run `pip install pandas`")
-        
-        doc_converter = DocumentConverter()
+        doc_converter = _docling_converter(do_ocr=kwargs.get("ocr", False), do_table_structure=True)
         conv_res = doc_converter.convert(path)
-        if format == "raw":
-            text = conv_res.document.export_to_text() + "\n\n"
-        elif format == "markdown":  
-            text = conv_res.document.export_to_markdown() + "\n\n"
-        for table in conv_res.document.tables:
-            table_df: pd.DataFrame = table.export_to_dataframe()
+        text = self._export_text(conv_res.document, format) + "\n\n"
+        for table_df in self._export_tables(conv_res.document):
             text += table_df.to_markdown() + "\n\n"
         return text
+
+    def get_pages(self, path: str, **kwargs) -> List[str]:
+        format = kwargs.get("format", "raw")
+        doc_converter = _docling_converter(do_ocr=kwargs.get("ocr", False), do_table_structure=False)
+        conv_res = doc_converter.convert(path)
+        return self._export_pages(conv_res.document, format)
+
+    def get_pages_and_tables(self, path: str, **kwargs):
+        """Extract the text of each page and the tables from a single docling conversion."""
+        format = kwargs.get("format", "raw")
+        doc_converter = _docling_converter(do_ocr=kwargs.get("ocr", False), do_table_structure=True)
+        conv_res = doc_converter.convert(path)
+        return self._export_pages(conv_res.document, format), self._export_tables(conv_res.document)
+
+    @staticmethod
+    def _convert_all(doc_converter, paths: List[str]) -> List:
+        """
+        Convert several documents with one docling batched conversion, in the order of `paths`.
+        A document docling fails to convert does not stop the batch: a warning is emitted and its document is None.
+        """
+        documents = []
+        for path, conv_res in zip(paths, doc_converter.convert_all(paths, raises_on_error=False)):
+            # ConversionStatus is a str enum
+            if conv_res.status in ("success", "partial_success"):
+                documents.append(conv_res.document)
+            else:
+                warnings.warn(f"docling could not convert {path}, conversion status: {conv_res.status}")
+                documents.append(None)
+        return documents
+
+    def get_text_batch(self, paths: List[str], **kwargs) -> List[str]:
+        """
+        Extract the text of several documents with one docling batched conversion.
+        A document that fails to convert gives an empty text and a warning, the other documents are kept.
+        """
+        format = kwargs.get("format", "raw")
+        doc_converter = _docling_converter(do_ocr=kwargs.get("ocr", False), do_table_structure=False)
+        return [
+            "" if document is None else self._export_text(document, format)
+            for document in self._convert_all(doc_converter, paths)
+        ]
+
+    def get_tables_batch(self, paths: List[str], **kwargs) -> List[List]:
+        """
+        Extract the tables of several documents with one docling batched conversion.
+        A document that fails to convert gives no table and a warning, the other documents are kept.
+        """
+        doc_converter = _docling_converter(do_ocr=kwargs.get("ocr", False), do_table_structure=True)
+        return [
+            [] if document is None else self._export_tables(document)
+            for document in self._convert_all(doc_converter, paths)
+        ]
     
 
 class PDFPlumberExtractor(BaseExtractor):
@@ -141,9 +245,20 @@ class PDFPlumberExtractor(BaseExtractor):
                 if table_data:
                     df = pd.DataFrame(table_data)
                     if not df.empty:
+                        df.attrs["page"] = page.page_number
                         tables.append(df)
         return tables
 
+    def get_pages(self, path: str, **kwargs) -> List[str]:
+        try:
+            import pdfplumber
+        except ImportError:
+            raise ImportError("'pdfplumber' is not installed. Run `pip install pdfplumber`")
+
+        with pdfplumber.open(path) as pdf:
+            pages = [(text_without_tables(page) or "").strip() for page in pdf.pages]
+        return pages
+
     def get_all(self, path: str, **kwargs)->str:
         try:
             import pdfplumber
@@ -196,9 +311,20 @@ class PyMuPDFExtractor(BaseExtractor):
             for table in page.find_tables():
                 df = table.to_pandas()
                 if not df.empty:
+                    df.attrs["page"] = page.number + 1
                     tables.append(df)
         return tables
 
+    def get_pages(self, path: str, **kwargs) -> List[str]:
+        try:
+            import fitz
+        except ImportError:
+            raise ImportError("'PyMuPDF' is not installed. Run `pip install pymupdf`")
+
+        doc = fitz.open(path)
+        pages = [page.get_text().strip() for page in doc]
+        return pages
+
     def get_all(self, path: str, **kwargs)->str:
         try:
             import fitz
@@ -237,30 +363,150 @@ class PyPDF2Extractor(BaseExtractor):
                 text += page_text.strip() + "\n\n"
         return text
 
+    def get_pages(self, path: str, **kwargs) -> List[str]:
+        try:
+            import PyPDF2
+        except ImportError:
+            raise ImportError("'PyPDF2' is not installed. Run `pip install PyPDF2`")
+
+        with open(path, "rb") as f:
+            reader = PyPDF2.PdfReader(f)
+            pages = [(page.extract_text() or "").strip() for page in reader.pages]
+        return pages
+
     def get_tables(self, path: str, **kwargs):
         pass
     def get_all(self, path: str, **kwargs):
         pass
 
+def _chunk_pages(n_pages: int, chunk_size: int) -> List[List[int]]:
+    """Split the 1-based page numbers of a document into consecutive chunks."""
+    pages = list(range(1, n_pages + 1))
+    return [pages[i:i + chunk_size] for i in range(0, n_pages, chunk_size)]
+
+
+def _has_ruling_lines(page, max_thickness: float = 3) -> bool:
+    """
+    Check if the rules of a pdfplumber page form a grid of at least 2 rows and 2 columns,
+    which camelot's lattice flavor can read.
+    Rules are lines, thin rects or paths (often used to draw table rules) and stroked shapes. Filled shapes
+    thicker than `max_thickness` (shaded cells, backgrounds) are not rules. A lone frame, like a page border,
+    only makes a single cell and does not count.
+    """
+    from pdfplumber.utils import obj_to_edges
+
+    edges = []
+    for obj in page.lines + page.rects + page.curves:
+        is_thin = min(obj["width"], obj["height"]) <= max_thickness
+        if obj["object_type"] == "line" or is_thin or obj.get("stroke"):
+            edges += obj_to_edges(obj)
+    table_settings = {
+        "vertical_strategy": "explicit",
+        "horizontal_strategy": "explicit",
+        "explicit_vertical_lines": [edge for edge in edges if edge["orientation"] == "v"],
+        "explicit_horizontal_lines": [edge for edge in edges if edge["orientation"] == "h"],
+    }
+    return any(
+        len(table.rows) >= 2 and len(table.columns) >= 2 for table in page.find_tables(table_settings)
+    )
+
+
+def _camelot_read_chunk(path: str, pages: List[int]) -> List:
+    """
+    Extract the tables of a chunk of pages with camelot, choosing lattice or stream per page.
+    Runs in a worker process, so it must stay a module level function.
+    """
+    import camelot
+    import pdfplumber
+
+    tables = []
+    with pdfplumber.open(path) as pdf:
+        for page_number in pages:
+            page = pdf.pages[page_number - 1]
+            flavor = "lattice" if _has_ruling_lines(page) else "stream"
+            tables_out = camelot.read_pdf(path, pages=str(page_number), flavor=flavor)
+            if flavor == "lattice" and all(table.df.empty for table in tables_out):
+                flavor = "stream"
+                tables_out = camelot.read_pdf(path, pages=str(page_number), flavor=flavor)
+            for table_index, table in enumerate(tables_out):
+                df = table.df
+                if df.empty:
+                    continue
+                df.attrs["page"] = page_number
+                df.attrs["table_index"] = table_index
+                df.attrs["flavor"] = flavor
+                tables.append(df)
+    return tables
+
+
 class CamelotExtractor(BaseExtractor):
     def __init__(self, capabilities=set()):
         super().__init__()
         self.capabilities = {"tables"}
 
     def get_tables(self, path: str, **kwargs)->List:
+        """
+        Extract tables page chunk by page chunk, optionally in parallel worker processes.
+        Each page is read with camelot's "lattice" flavor when its ruling lines form a grid, "stream" otherwise
+        or when lattice finds no table.
+        The page number and the index of the table in its page are kept in `df.attrs`.
+
+        Lattice renders the page to an image and is much slower than stream, about 0.5s per ruled page,
+        so on long documents with many ruled pages set `n_jobs` to spread the pages over worker processes.
+        With `n_jobs` other than 1, on platforms starting processes with spawn (macOS, Windows),
+        the calling script must be protected by `if __name__ == "__main__":`.
+
+        Args:
+            path (str): path of the pdf file.
+            n_jobs (int, optional): number of worker processes, -1 for the number of cpus.
+                Defaults to 1, no worker process.
+            chunk_size (int, optional): number of pages processed by a worker at once. Defaults to 4.
+
+        Returns:
+            List: the extracted tables as DataFrames, ordered by page then by table index.
+        """
         try:
-            import camelot
+            import camelot  # noqa: F401
         except ImportError:
             raise ImportError("'camelot' is not installed. Run `pip install camelot`")
+        import pdfplumber
+
+        n_jobs = kwargs.get("n_jobs", 1)
+        chunk_size = kwargs.get("chunk_size", 4)
+        if not isinstance(n_jobs, int) or (n_jobs < 1 and n_jobs != -1):
+            raise ValueError(f"n_jobs must be a positive integer or -1 for the number of cpus, got {n_jobs}.")
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+
+        with pdfplumber.open(path) as pdf:
+            n_pages = len(pdf.pages)
+        chunks = _chunk_pages(n_pages, chunk_size)
 
-        tables_out = camelot.read_pdf(path, pages="all", flavor="stream")
-        tables = [table.df for table in tables_out if not table.df.empty]
+        if n_jobs == 1 or len(chunks) <= 1:
+            results = [_camelot_read_chunk(path, chunk) for chunk in chunks]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(chunks))) as executor:
+                results = list(executor.map(_camelot_read_chunk, [path] * len(chunks), chunks))
+
+        # executor.map keeps the order of the chunks, so the tables are already sorted by page
+        tables = [table for chunk_tables in results for table in chunk_tables]
 
         return tables
 
     def get_text(self, path: str, **kwargs):
         pass
 
+    def get_pages(self, path: str, **kwargs) -> List[str]:
+        # no text capability: one empty page per pdf page, so the tables keep their page in a store
+        import pdfplumber
+
+        with pdfplumber.open(path) as pdf:
+            return [""] * len(pdf.pages)
+
     def get_all(self, path: str):
         pass
 
@@ -0,0 +1,174 @@
+# Copyright 2025 Mews Labs
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk store of an extraction result, readable page by page.
+
+Layout of a store file (little endian):
+    header       magic b"PAPY", version, number of pages, number of tables,
+                 offset of the page index, offset of the table index
+    segments     utf-8 page texts, and tables serialized as json: {"attrs": df.attrs, "table": pandas "split" orient}
+    page index   one (offset, length, first table, number of tables) entry per page
+    table index  one (offset, length, page) entry per table
+
+Tables are written grouped by page, in page order, so the tables of a page are a contiguous
+range of the table index. The indexes have fixed size entries: a page, a table or the tables
+of a page are found in O(1) and only their own segments are decoded.
+"""
+
+import json
+import mmap
+import struct
+from typing import List
+
+MAGIC = b"PAPY"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHxxIIQQ")
+_PAGE_ENTRY = struct.Struct("<QQII")
+_TABLE_ENTRY = struct.Struct("<QQI4x")
+
+
+def write_store(store_path: str, pages: List[str], tables: List) -> None:
+    """
+    Write the pages text and the tables of a document to a store file.
+
+    Args:
+        store_path (str): path of the store file to write.
+        pages (List[str]): text of each page, in page order.
+        tables (List): DataFrames, their page number (1-based) is read from `df.attrs["page"]`, 0 if unknown.
+            Tables of unknown page are written after the others and are only reachable with `get_table`.
+            Empty pages are added if a table is on a page after the last one of `pages`.
+    """
+    last_table_page = max((table.attrs.get("page", 0) for table in tables), default=0)
+    pages = list(pages) + [""] * (last_table_page - len(pages))
+    n_pages = len(pages)
+    tables = sorted(tables, key=lambda table: _table_page(table, n_pages) or n_pages + 1)
+    page_tables_count = [0] * (n_pages + 1)
+    for table in tables:
+        page_tables_count[_table_page(table, n_pages)] += 1
+
+    page_entries = []
+    table_entries = []
+    with open(store_path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        first_table = 0
+        for page_number, page_text in enumerate(pages, start=1):
+            segment = page_text.encode("utf-8")
+            page_entries.append((f.tell(), len(segment), first_table, page_tables_count[page_number]))
+            first_table += page_tables_count[page_number]
+            f.write(segment)
+        for table in tables:
+            segment = (
+                '{"attrs": ' + json.dumps(table.attrs, default=str) + ', "table": ' + table.to_json(orient="split") + "}"
+            ).encode("utf-8")
+            table_entries.append((f.tell(), len(segment), _table_page(table, n_pages)))
+            f.write(segment)
+
+        page_index_offset = f.tell()
+        for entry in page_entries:
+            f.write(_PAGE_ENTRY.pack(*entry))
+        table_index_offset = f.tell()
+        for entry in table_entries:
+            f.write(_TABLE_ENTRY.pack(*entry))
+
+        f.seek(0)
+        f.write(
+            _HEADER.pack(MAGIC, VERSION, len(page_entries), len(table_entries), page_index_offset, table_index_offset)
+        )
+
+
+def _table_page(table, n_pages: int) -> int:
+    """Page number of a table, 0 if it is unknown or out of the document."""
+    page = table.attrs.get("page", 0)
+    return page if 1 <= page <= n_pages else 0
+
+
+class ExtractionStore:
+    """
+    Read-only access to a store file written by `write_store`, through mmap.
+
+    Pages are numbered from 1, like in the pdf. Tables are numbered from 0, grouped by page in page order.
+    """
+
+    def __init__(self, store_path: str):
+        self._file = open(store_path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{store_path} is not a papyrus extraction store.")
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{store_path} is not a papyrus extraction store.")
+        magic, version, self.n_pages, self.n_tables, self._page_index_offset, self._table_index_offset = (
+            _HEADER.unpack_from(self._mmap, 0)
+        )
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{store_path} is not a papyrus extraction store.")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported store version {version}, expected {VERSION}.")
+        if (
+            self._page_index_offset + self.n_pages * _PAGE_ENTRY.size > len(self._mmap)
+            or self._table_index_offset + self.n_tables * _TABLE_ENTRY.size > len(self._mmap)
+        ):
+            self.close()
+            raise ValueError(f"{store_path} is not a papyrus extraction store.")
+
+    def get_page(self, page_number: int) -> str:
+        """Return the text of a page (1-based)."""
+        if not 1 <= page_number <= self.n_pages:
+            raise IndexError(f"Page {page_number} out of range, the document has {self.n_pages} pages.")
+        offset, length, _, _ = self._page_entry(page_number)
+        return self._mmap[offset:offset + length].decode("utf-8")
+
+    def get_table(self, table_index: int):
+        """
+        Return a table (0-based) as a DataFrame, with the attrs it was written with and its page number
+        in `df.attrs["page"]`. Cells keep their json type: text stays text and empty cells stay None.
+        """
+        import pandas as pd
+
+        if not 0 <= table_index < self.n_tables:
+            raise IndexError(f"Table {table_index} out of range, the document has {self.n_tables} tables.")
+        offset, length, page = self._table_entry(table_index)
+        # built from the parsed json rather than pd.read_json, whose type inference turns "007" into 7
+        segment = json.loads(self._mmap[offset:offset + length].decode("utf-8"))
+        table = segment["table"]
+        df = pd.DataFrame(table["data"], index=table["index"], columns=table["columns"], dtype=object)
+        df.attrs.update(segment["attrs"])
+        df.attrs["page"] = page
+        return df
+
+    def get_page_tables(self, page_number: int) -> List:
+        """Return the tables of a page (1-based)."""
+        if not 1 <= page_number <= self.n_pages:
+            raise IndexError(f"Page {page_number} out of range, the document has {self.n_pages} pages.")
+        _, _, first_table, n_tables = self._page_entry(page_number)
+        return [self.get_table(table_index) for table_index in range(first_table, first_table + n_tables)]
+
+    def _page_entry(self, page_number: int):
+        return _PAGE_ENTRY.unpack_from(self._mmap, self._page_index_offset + (page_number - 1) * _PAGE_ENTRY.size)
+
+    def _table_entry(self, table_index: int):
+        return _TABLE_ENTRY.unpack_from(self._mmap, self._table_index_offset + table_index * _TABLE_ENTRY.size)
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
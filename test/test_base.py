@@ -103,3 +103,281 @@ def run_extractor_content_all(extractor_name):
     papyrus_extractor = PapyrusExtractor(extractor=extractor_name)
     text = papyrus_extractor.get_all(path, True)
     assert isinstance(text, str), "text must be typed as str"
+
+
+def test_camelot_chunk_pages():
+    from papyrus.engine.extractor import _chunk_pages
+
+    assert _chunk_pages(10, 4) == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+    assert _chunk_pages(0, 4) == []
+
+
+def make_pdf(file_path, layouts):
+    """
+    Write a pdf with one page per layout, built with pymupdf:
+    "grid" is a table ruled with line objects, "rules" a table ruled with thin filled rects,
+    "border" a borderless table inside a page border rect.
+    """
+    import fitz
+
+    doc = fitz.open()
+    for layout in layouts:
+        page = doc.new_page()
+        x_positions = [72, 200, 328, 456]
+        y_positions = [100, 130, 160, 190, 220]
+        for row, y in enumerate(y_positions[:-1]):
+            for col, x in enumerate(x_positions[:-1]):
+                page.insert_text((x + 5, y + 20), f"cell {row}{col}")
+        if layout == "grid":
+            for y in y_positions:
+                page.draw_line((x_positions[0], y), (x_positions[-1], y))
+            for x in x_positions:
+                page.draw_line((x, y_positions[0]), (x, y_positions[-1]))
+        elif layout == "rules":
+            for y in y_positions:
+                page.draw_rect(fitz.Rect(x_positions[0], y - 0.5, x_positions[-1], y + 0.5), color=None, fill=(0, 0, 0))
+            for x in x_positions:
+                page.draw_rect(fitz.Rect(x - 0.5, y_positions[0], x + 0.5, y_positions[-1]), color=None, fill=(0, 0, 0))
+        elif layout == "border":
+            page.draw_rect(fitz.Rect(20, 20, page.rect.width - 20, page.rect.height - 20))
+    doc.save(file_path)
+
+
+def test_has_ruling_lines(tmp_path):
+    import pdfplumber
+
+    from papyrus.engine.extractor import _has_ruling_lines
+
+    file_path = str(tmp_path / "layouts.pdf")
+    make_pdf(file_path, ["grid", "border", "rules"])
+    with pdfplumber.open(file_path) as pdf:
+        assert _has_ruling_lines(pdf.pages[0])
+        assert not _has_ruling_lines(pdf.pages[1])
+        assert _has_ruling_lines(pdf.pages[2])
+
+
+def test_camelot_tables_keep_page_index(tmp_path):
+    file_path = str(tmp_path / "tables.pdf")
+    make_pdf(file_path, ["grid", "border", "rules"])
+    tables = PapyrusExtractor(extractor="camelot").get_tables(file_path, n_jobs=2, chunk_size=1)
+    assert [(table.attrs["page"], table.attrs["table_index"]) for table in tables] == [(1, 0), (2, 0), (3, 0)]
+    assert [table.attrs["flavor"] for table in tables] == ["lattice", "stream", "lattice"]
+    assert tables[0].iloc[0, 0] == "cell 00"
+    assert tables[2].iloc[0, 0] == "cell 00"
+
+
+@pytest.mark.parametrize("kwargs", [{"n_jobs": 0}, {"n_jobs": -2}, {"chunk_size": 0}])
+def test_camelot_invalid_parallel_settings(kwargs):
+    with pytest.raises(ValueError):
+        CamelotExtractor().get_tables(path, **kwargs)
+
+
+def test_extraction_store_random_access(tmp_path):
+    import pandas as pd
+
+    from papyrus.tools.extraction_store import ExtractionStore, write_store
+
+    table = pd.DataFrame([["a", "b"], ["c", "d"]])
+    table.attrs["page"] = 2
+    text_cells = pd.DataFrame([[None, "007", "2024-01-02", "5"]])
+    text_cells.attrs.update(page=1, table_index=0, flavor="lattice")
+    unknown_page = pd.DataFrame([["x"]])
+    store_path = str(tmp_path / "doc.papy")
+    write_store(store_path, ["first page", "deuxième page", ""], [table, unknown_page, text_cells])
+
+    with ExtractionStore(store_path) as store:
+        assert store.n_pages == 3
+        assert store.n_tables == 3
+        assert store.get_page(2) == "deuxième page"
+        assert store.get_page(3) == ""
+        assert [df.values.tolist() for df in store.get_page_tables(1)] == [[[None, "007", "2024-01-02", "5"]]]
+        assert store.get_table(0).attrs == {"page": 1, "table_index": 0, "flavor": "lattice"}
+        assert [df.values.tolist() for df in store.get_page_tables(2)] == [[["a", "b"], ["c", "d"]]]
+        assert store.get_page_tables(3) == []
+        assert store.get_table(2).values.tolist() == [["x"]]
+        assert store.get_table(2).attrs["page"] == 0
+        with pytest.raises(IndexError):
+            store.get_page(4)
+
+    with open(store_path, "r+b") as f:
+        f.truncate(64)
+    with pytest.raises(ValueError, match="not a papyrus extraction store"):
+        ExtractionStore(store_path)
+
+
+def test_save_extraction_store_tables_only(tmp_path):
+    from papyrus.tools.extraction_store import ExtractionStore
+
+    file_path = str(tmp_path / "tables.pdf")
+    store_path = str(tmp_path / "tables.papy")
+    make_pdf(file_path, ["border", "grid"])
+    PapyrusExtractor(extractor="camelot").save(file_path, store_path)
+
+    with ExtractionStore(store_path) as store:
+        assert store.n_pages == 2
+        assert store.get_page(2) == ""
+        page_tables = store.get_page_tables(2)
+        assert len(page_tables) == 1
+        assert page_tables[0].attrs == {"page": 2, "table_index": 0, "flavor": "lattice"}
+
+
+def test_save_extraction_store(tmp_path):
+    from papyrus.tools.extraction_store import ExtractionStore
+
+    store_path = str(tmp_path / "invoice_100.papy")
+    PapyrusExtractor(extractor="pdfplumber").save(path, store_path)
+
+    pages = PDFPlumberExtractor().get_pages(path)
+    tables = PDFPlumberExtractor().get_tables(path)
+    with ExtractionStore(store_path) as store:
+        assert store.n_pages == len(pages)
+        assert [store.get_page(page_number) for page_number in range(1, store.n_pages + 1)] == pages
+        assert store.n_tables == len(tables)
+        for table_index, table in enumerate(tables):
+            stored_table = store.get_table(table_index)
+            assert stored_table.attrs["page"] == table.attrs["page"]
+            assert stored_table.values.tolist() == table.values.tolist()
+
+
+class FakeDoclingTable:
+    prov = [type("Prov", (), {"page_no": 2})()]
+
+    def __init__(self, path):
+        self.path = path
+
+    def export_to_dataframe(self):
+        import pandas as pd
+
+        return pd.DataFrame([[self.path]])
+
+
+class FakeDoclingDocument:
+    pages = {2: None, 1: None}
+
+    def __init__(self, path):
+        self.path = path
+        self.tables = [FakeDoclingTable(path)]
+
+    def export_to_text(self):
+        return f"text of {self.path}"
+
+    def export_to_markdown(self, page_no=None, strict_text=False):
+        assert strict_text
+        return f"page {page_no}"
+
+
+class FakeDoclingConverter:
+    """Records how the docling converters are built and called, "broken.pdf" fails to convert."""
+
+    def __init__(self, calls, **options):
+        self.calls = calls
+        calls.append(("build", options))
+
+    def _result(self, path):
+        status = "failure" if path == "broken.pdf" else "success"
+        return type("ConversionResult", (), {"document": FakeDoclingDocument(path), "status": status})()
+
+    def convert(self, path):
+        self.calls.append(("convert", path))
+        return self._result(path)
+
+    def convert_all(self, paths, raises_on_error=True):
+        self.calls.append(("convert_all", list(paths), raises_on_error))
+        return (self._result(path) for path in paths)
+
+
+@pytest.fixture
+def docling_calls(monkeypatch):
+    from papyrus.engine import extractor as extractor_module
+
+    calls = []
+    monkeypatch.setattr(
+        extractor_module, "_docling_converter", lambda **options: FakeDoclingConverter(calls, **options)
+    )
+    return calls
+
+
+def test_docling_pages_and_tables_single_conversion(docling_calls):
+    pages, tables = DoclingExtractor().get_pages_and_tables(path)
+    assert [call for call in docling_calls if call[0] == "convert"] == [("convert", path)]
+    assert pages == ["page 1", "page 2"]
+    assert tables[0].attrs["page"] == 2
+
+
+@pytest.mark.parametrize(
+    "method_name, ocr, expected_options",
+    [
+        ("get_text", False, {"do_ocr": False, "do_table_structure": False}),
+        ("get_text", True, {"do_ocr": True, "do_table_structure": False}),
+        ("get_tables", False, {"do_ocr": False, "do_table_structure": True}),
+        ("get_tables", True, {"do_ocr": True, "do_table_structure": True}),
+        ("get_all", False, {"do_ocr": False, "do_table_structure": True}),
+    ],
+)
+def test_docling_pipeline_options_per_capability(docling_calls, method_name, ocr, expected_options):
+    getattr(DoclingExtractor(), method_name)(path, ocr=ocr)
+    assert docling_calls[0] == ("build", expected_options)
+
+
+def test_docling_batch_single_conversion(docling_calls):
+    paths = ["b.pdf", "a.pdf", "c.pdf"]
+    texts = PapyrusExtractor(extractor="docling").get_text_batch(paths)
+    assert texts == ["text of b.pdf", "text of a.pdf", "text of c.pdf"]
+    assert docling_calls == [
+        ("build", {"do_ocr": False, "do_table_structure": False}),
+        ("convert_all", paths, False),
+    ]
+
+    tables = DoclingExtractor().get_tables_batch(paths)
+    assert [document_tables[0].iloc[0, 0] for document_tables in tables] == paths
+    assert [call[0] for call in docling_calls[2:]] == ["build", "convert_all"]
+
+
+def test_docling_batch_keeps_converted_documents(docling_calls):
+    with pytest.warns(UserWarning, match="broken.pdf"):
+        texts = DoclingExtractor().get_text_batch(["a.pdf", "broken.pdf", "c.pdf"])
+    assert texts == ["text of a.pdf", "", "text of c.pdf"]
+    with pytest.warns(UserWarning, match="broken.pdf"):
+        tables = DoclingExtractor().get_tables_batch(["broken.pdf", "a.pdf"])
+    assert [len(document_tables) for document_tables in tables] == [0, 1]
+
+
+def test_text_and_tables_batch_keep_paths_order(tmp_path):
+    grid_path = str(tmp_path / "grid.pdf")
+    empty_path = str(tmp_path / "empty.pdf")
+    make_pdf(grid_path, ["grid"])
+    make_pdf(empty_path, [None])
+    papyrus_extractor = PapyrusExtractor(extractor="pdfplumber")
+
+    texts = papyrus_extractor.get_text_batch([empty_path, grid_path, empty_path])
+    assert texts == [papyrus_extractor.get_text(p) for p in [empty_path, grid_path, empty_path]]
+
+    tables = papyrus_extractor.get_tables_batch([grid_path, empty_path])
+    assert [len(document_tables) for document_tables in tables] == [1, 0]
+
+
+def test_ocr_requires_capability():
+    papyrus_extractor = PapyrusExtractor(extractor="pdfplumber")
+    with pytest.raises(ValueError):
+        papyrus_extractor.get_text(path, ocr=True)
+    with pytest.raises(ValueError):
+        papyrus_extractor.get_all(path, ocr=True)
+
+
+def test_docling_converter_options():
+    pytest.importorskip("docling")
+    from docling.datamodel.base_models import InputFormat
+
+    from papyrus.engine.extractor import _docling_converter
+
+    text_options = _docling_converter(do_ocr=False, do_table_structure=False).format_to_options[InputFormat.PDF]
+    assert not text_options.pipeline_options.do_table_structure
+    assert not text_options.pipeline_options.do_ocr
+    ocr_options = _docling_converter(do_ocr=True, do_table_structure=True).format_to_options[InputFormat.PDF]
+    assert ocr_options.pipeline_options.do_table_structure
+    assert ocr_options.pipeline_options.do_ocr
+
+
+def test_docling_unsupported_format():
+    with pytest.raises(ValueError, match="Unsupported format"):
+        DoclingExtractor._export_text(None, "html")